@@ -8,7 +8,7 @@ Key goals:
 - JAWS-like tag blocks: "Tag X has N parameters" with key=value lines
 - Always show effective href where possible (links, images inside links, and #document URL)
 - Promote nested nodes to canonical elements (e.g., img->a, placeholder->contenteditable host)
-- Readable, stable output with blank line before each Tag block
+- Readable, stable output with each Tag block under its own heading
 
 Changelog:
 - 0.1.43: Report aria-describedby as description= and include describedby id.
@@ -21,20 +21,28 @@ import browseMode
 import controlTypes
 import globalPluginHandler
 import html
+import io
+from collections import deque
 from scriptHandler import script
+from sys import intern
 
 # ===== DEBUG MODE (temporary, always active) =====
 import logHandler
 DEBUG_MODE = False
-def _dbg(msg):
+def _dbg(fmt, *args):
+    """Log a debug line; fmt % args is only evaluated when DEBUG_MODE is on."""
     if not DEBUG_MODE:
         return
     try:
-        logHandler.log.warning("[WebElementInspector DEBUG] " + str(msg))
+        msg = "[WebElementInspector DEBUG] " + (fmt % args if args else str(fmt))
+    except Exception:
+        return
+    try:
+        logHandler.log.warning(msg)
     except Exception:
         pass
     try:
-        logHandler.log.debug("[WebElementInspector DEBUG] " + str(msg))
+        logHandler.log.debug(msg)
     except Exception:
         pass
 # ===== END DEBUG MODE =====
@@ -48,86 +56,100 @@ def _safe_int_hex(v):
     except Exception:
         return None
 
+try:
+    import comInterfaces
+    _IA2_IFACE = getattr(comInterfaces, "IAccessible2", None)
+except Exception:
+    _IA2_IFACE = None
+
+# IA2 attributes and NVDA properties worth logging per object in debug mode.
+_DBG_IA2_KEYS = (
+    "id", "class", "name", "name-from", "description-from", "xml-roles", "role",
+    "aria-describedby", "describedby", "describedBy", "describedby-text",
+    "html-input-name", "text-input-type", "text-model",
+)
+_DBG_ATTRS = ("name", "value", "description", "role", "states", "isEnabled", "location")
+
+
 def _dbg_obj(o, label):
     """Log high-signal properties for an NVDAObject without huge dumps."""
     if not DEBUG_MODE:
         return
     if o is None:
-        _dbg(f"{label}: <None>")
+        _dbg("%s: <None>", label)
         return
-    try:
-        _dbg(f"{label}: {o!r}")
-    except Exception:
-        _dbg(f"{label}: <unrepr>")
+    _dbg("%s: %r", label, o)
     # Tag and IA2 attrs (keys only + a few important values)
     try:
         ia2 = getattr(o, "IA2Attributes", None) or {}
     except Exception:
         ia2 = {}
     try:
-        tag = ia2.get("tag") or _tag(o)
-    except Exception:
-        tag = None
-    try:
-        _dbg(f"{label} tag: {tag}")
+        _dbg("%s tag: %s", label, ia2.get("tag") or _tag(o))
     except Exception:
         pass
     try:
-        keys = sorted(list(ia2.keys()))
+        keys = sorted(ia2.keys())
         # Keep it small: show keys + selected important ones.
-        _dbg(f"{label} IA2 keys({len(keys)}): {keys[:20]}" + (" ..." if len(keys) > 20 else ""))
+        _dbg("%s IA2 keys(%d): %s%s", label, len(keys), keys[:20], " ..." if len(keys) > 20 else "")
+        for k in _DBG_IA2_KEYS:
+            v = ia2.get(k)
+            if v not in (None, ""):
+                _dbg("%s IA2 %s=%s", label, k, v)
     except Exception:
         pass
 
-    for k in ("id", "class", "name", "name-from", "description-from", "xml-roles", "role", "aria-describedby", "describedby", "describedBy", "describedby-text", "html-input-name", "text-input-type", "text-model"):
-        try:
-            if k in ia2 and ia2.get(k) not in (None, ""):
-                _dbg(f"{label} IA2 {k}={ia2.get(k)}")
-        except Exception:
-            pass
-
-    # NVDA computed properties
-    for attr in ("name", "value", "description", "role", "states", "isEnabled", "location"):
+    # NVDA computed properties; one failing getter must not hide the others.
+    for attr in _DBG_ATTRS:
         try:
             v = getattr(o, attr, None)
-        except Exception:
-            v = None
+        except Exception as e:
+            _dbg("%s %s FAILED: %s", label, attr, e)
+            continue
         if v is None:
             continue
-        try:
-            if attr == "states":
-                # Don't spam: show up to 12 state names
-                sv = list(v) if isinstance(v, (set, list, tuple)) else [v]
-                _dbg(f"{label} states({len(sv)}): {sv[:12]}" + (" ..." if len(sv) > 12 else ""))
-            else:
-                _dbg(f"{label} {attr}={v}")
-        except Exception:
-            pass
+        if attr == "states":
+            # Don't spam: show up to 12 state names
+            sv = list(v) if isinstance(v, (set, list, tuple)) else [v]
+            _dbg("%s states(%d): %s%s", label, len(sv), sv[:12], " ..." if len(sv) > 12 else "")
+        else:
+            _dbg("%s %s=%s", label, attr, v)
 
     # Raw MSAA/IA2 roles (COM) — can be unstable; log failures explicitly.
     ia = getattr(o, "IAccessibleObject", None)
     if ia:
         try:
-            r = ia.accRole(0)
-            hx = _safe_int_hex(r)
+            hx = _safe_int_hex(ia.accRole(0))
             if hx is not None:
-                _dbg(f"{label} MSAA accRole hex={hx}")
+                _dbg("%s MSAA accRole hex=%s", label, hx)
         except Exception as e:
-            _dbg(f"{label} MSAA accRole FAILED: {e}")
-        try:
-            import comInterfaces
-            IA2 = getattr(comInterfaces, "IAccessible2", None)
-            if IA2:
-                ia2if = ia.QueryInterface(IA2)
-                rr = getattr(ia2if, "role", None)
-                hx = _safe_int_hex(rr)
+            _dbg("%s MSAA accRole FAILED: %s", label, e)
+        if _IA2_IFACE:
+            try:
+                hx = _safe_int_hex(getattr(ia.QueryInterface(_IA2_IFACE), "role", None))
                 if hx is not None:
-                    _dbg(f"{label} IA2 role hex={hx}")
-        except Exception as e:
-            _dbg(f"{label} IA2 role FAILED: {e}")
+                    _dbg("%s IA2 role hex=%s", label, hx)
+            except Exception as e:
+                _dbg("%s IA2 role FAILED: %s", label, e)
 
 addonHandler.initTranslation()
 
+# controlTypes enum members, resolved once. None when this NVDA build lacks one;
+# _state_in treats a None state as absent.
+_State = getattr(controlTypes, "State", None)
+_Role = getattr(controlTypes, "Role", None)
+_S_REQUIRED = getattr(_State, "REQUIRED", None)
+_S_CHECKED = getattr(_State, "CHECKED", None)
+_S_PRESSED = getattr(_State, "PRESSED", None)
+_S_EXPANDED = getattr(_State, "EXPANDED", None)
+_S_COLLAPSED = getattr(_State, "COLLAPSED", None)
+_S_SELECTED = getattr(_State, "SELECTED", None)
+_S_ON = getattr(_State, "ON", None)
+_S_FOCUSABLE = getattr(_State, "FOCUSABLE", None)
+_S_FOCUSED = getattr(_State, "FOCUSED", None)
+_R_BUTTON = getattr(_Role, "BUTTON", None)
+_R_TOGGLE = getattr(_Role, "TOGGLEBUTTON", None)
+
 
 def _safe(v):
     try:
@@ -136,22 +158,105 @@ def _safe(v):
         return ""
 
 
+def _s(x):
+    """Stripped string form of x; "" for None. Skips _safe's try/except for str values."""
+    return x.strip() if isinstance(x, str) else ("" if x is None else str(x).strip())
+
+
+def _lc(d, k):
+    """Stripped, lowercased string value of d[k] ("" when absent)."""
+    v = d.get(k)
+    return v.strip().lower() if isinstance(v, str) else ""
+
+
+def _lv(d, k):
+    """Stripped string value of d[k] ("" when absent)."""
+    v = d.get(k)
+    return v.strip() if isinstance(v, str) else ""
+
+
+_HTTP_PREFIXES = ("http://", "https://")
+_DESCRIBEDBY_ALIASES = frozenset({"aria-describedby", "describedby"})
+_CHECKED_ALIASES = frozenset({"aria-checked", "checked", "ariachecked"})
+# Enum-like attributes whose values repeat across many elements; their values are interned.
+_INTERN_KEYS = frozenset({
+    "role", "xml-roles", "type", "tag", "accessible-name-from", "explicit-name-from",
+    "pressed", "expanded", "selected", "checked", "description-from",
+})
+
+_INTERACTIVE_TAGS = frozenset({"input", "textarea", "select", "button"})
+_INTERACTIVE_ROLES = frozenset({
+    "button", "checkbox", "radio", "combobox", "listbox", "textbox", "searchbox",
+    "slider", "spinbutton", "menuitem", "option", "switch", "tab", "treeitem",
+})
+_SELECTABLE_ROLES = frozenset({"tab", "option", "treeitem"})
+_POPUP_ROLES = frozenset({"menu", "listbox", "dialog", "tree", "grid"})
+# Tags where MSAA accRole is usually meaningful.
+_CONTROL_TAGS = frozenset({"input", "textarea", "select", "button", "option", "meter", "progress"})
+# Tags (including none) on which a toggle role may carry a pressed state.
+_TOGGLE_TAGS = frozenset({"button", "a", "div", "span", ""})
+# Accepted pressed/aria-pressed spellings -> reported value.
+_PRESSED_MAP = {
+    "0": "false", "false": "false", "no": "false",
+    "1": "true", "true": "true", "yes": "true",
+}
+# Document-level tags that are never form fields or tab stops.
+_DOC_TAGS = frozenset({"#document", "body", "html"})
+
+# Per-NVDAObject caches (normalized IA2 attributes, states, DOM chains) for one
+# inspection. Keyed by id(obj); the keepalive deque holds the objects so an id
+# cannot be reused by a new object while its entry is still cached.
+_IA2_CACHE = {}
+_STATES_CACHE = {}
+_CHAIN_CACHE = {}
+_OBJ_CACHES = (_IA2_CACHE, _STATES_CACHE, _CHAIN_CACHE)
+_CACHE_KEEPALIVE = deque()
+_CACHE_MAX = 256
+
+
+def _clear_caches():
+    """Drop per-inspection caches and release the NVDAObjects they kept alive."""
+    for cache in _OBJ_CACHES:
+        cache.clear()
+    _CACHE_KEEPALIVE.clear()
+
+
+def _cache_put(cache, obj, value):
+    _CACHE_KEEPALIVE.append(obj)
+    if len(_CACHE_KEEPALIVE) > _CACHE_MAX:
+        oid = id(_CACHE_KEEPALIVE.popleft())
+        for c in _OBJ_CACHES:
+            c.pop(oid, None)
+    cache[id(obj)] = value
+
+
 def _ia2_attrs(obj):
+    cached = _IA2_CACHE.get(id(obj))
+    if cached is not None:
+        return cached
     out = {}
     try:
         ia2 = getattr(obj, "IA2Attributes", None)
         if isinstance(ia2, dict):
+            # Local bindings for the per-attribute loop.
+            safe = _safe
+            intern_ = intern
+            describedby_aliases = _DESCRIBEDBY_ALIASES
+            checked_aliases = _CHECKED_ALIASES
+            intern_keys = _INTERN_KEYS
             for k, v in ia2.items():
-                ks = _safe(k).strip()
-                if ks:
-                    ksl = ks.lower()
-                if ksl in ("aria-describedby", "describedby"):
+                ks = safe(k).strip()
+                if not ks:
+                    continue
+                ksl = ks.lower()
+                if ksl in describedby_aliases:
                     ks = "describedby"
-                elif ksl in ("aria-checked", "checked", "ariachecked"):
-                    ks = "checked"
-                elif ksl in ("aria-checked", "checked", "ariachecked"):
+                elif ksl in checked_aliases:
                     ks = "checked"
-                out[ks] = _safe(v).strip()
+                vs = v.strip() if isinstance(v, str) else safe(v).strip()
+                if ks in intern_keys:
+                    vs = intern_(vs)
+                out[intern_(ks)] = vs
         elif isinstance(ia2, str) and ia2.strip():
             parts = [p.strip() for p in ia2.split(";") if p.strip()]
             for p in parts:
@@ -159,9 +264,12 @@ def _ia2_attrs(obj):
                     k, v = p.split(":", 1)
                     ks = k.strip()
                     ksl = ks.lower()
-                    if ksl in ("aria-describedby", "describedby"):
+                    if ksl in _DESCRIBEDBY_ALIASES:
                         ks = "describedby"
-                    out[ks] = v.strip()
+                    vs = v.strip()
+                    if ks in _INTERN_KEYS:
+                        vs = intern(vs)
+                    out[intern(ks)] = vs
     except Exception:
         pass
 
@@ -182,7 +290,7 @@ def _ia2_attrs(obj):
                 out["value"] = out.get("aria-valuetext", "").strip()
             else:
                 v = getattr(obj, "value", None)
-                vs = _safe(v).strip()
+                vs = _s(v)
                 if vs:
                     out["value"] = vs
 
@@ -191,9 +299,9 @@ def _ia2_attrs(obj):
         # prefer reporting it as href to match HTML semantics. Only applies when href is absent.
         try:
             if out.get("tag", "").strip().lower() == "a":
-                href = _safe(out.get("href", "")).strip()
-                v = _safe(out.get("value", "")).strip()
-                if (not href) and (v.startswith("http://") or v.startswith("https://")):
+                href = _lv(out, "href")
+                v = _lv(out, "value")
+                if (not href) and v.startswith(_HTTP_PREFIXES):
                     out["href"] = v
                     out.pop("value", None)
         except Exception:
@@ -201,51 +309,47 @@ def _ia2_attrs(obj):
     except Exception:
         pass
 
-
+    _cache_put(_IA2_CACHE, obj, out)
     return out
 
 
 def _tag(obj):
-    try:
-        return _ia2_attrs(obj).get("tag", "").strip().lower()
-    except Exception:
-        return ""
+    return _ia2_attrs(obj).get("tag", "").lower()
 
 
 
 def _prefer_interactive_container(obj):
     """Prefer a nearby interactive container (e.g. button-like role) over decorative children."""
+    # Common case: already a button, no ancestor walk needed.
+    if _tag(obj) == "button":
+        return obj
+    ia2_attrs = _ia2_attrs
+    lc = _lc
     try:
         cur = obj
         steps = 0
         while cur and steps < 7:
-            a = _ia2_attrs(cur)
-            t = _safe(a.get("tag", "")).strip().lower()
-            roleLower = _safe(a.get("role", "")).strip().lower()
-            xmlRoleLower = _safe(a.get("xml-roles", "")).strip().lower()
-            haspopup = _safe(a.get("haspopup", "")).strip().lower()
-            tabindex = _safe(a.get("tabindex", "")).strip()
-            fsff = _safe(a.get("fsFormField", "")).strip().lower()
-
-            if t == "button":
+            a = ia2_attrs(cur)
+            if lc(a, "tag") == "button":
                 return cur
+            roleLower = lc(a, "role")
+            xmlRoleLower = lc(a, "xml-roles")
+            haspopup = lc(a, "haspopup")
+            tabindex = _lv(a, "tabindex")
+            fsff = lc(a, "fsFormField")
 
             # Common button-like patterns on modern web apps (e.g., Google):
             # role/button + tabindex=0, or haspopup signals menu button.
             if (roleLower == "button" or xmlRoleLower == "button") and tabindex == "0":
                 return cur
-            if haspopup in ("menu", "listbox", "dialog", "tree", "grid"):
+            if haspopup in _POPUP_ROLES:
                 return cur
             if fsff == "true" and (roleLower or xmlRoleLower):
                 return cur
 
             # Some controls may expose role=button via NVDA role enum.
-            try:
-                Role = getattr(controlTypes, "Role", None)
-                if Role and getattr(cur, "role", None) == getattr(Role, "BUTTON", None):
-                    return cur
-            except Exception:
-                pass
+            if _R_BUTTON is not None and getattr(cur, "role", None) == _R_BUTTON:
+                return cur
 
             cur = getattr(cur, "parent", None)
             steps += 1
@@ -292,96 +396,147 @@ def _get_candidate_object():
         return None
 
 
-def _states_set(obj):
-    try:
-        st = getattr(obj, "states", None)
-        return set(st) if st else set()
-    except Exception:
-        return set()
+def _states_of(obj):
+    """obj.states as a frozenset, fetched once per object per inspection."""
+    s = _STATES_CACHE.get(id(obj))
+    if s is None:
+        try:
+            raw = getattr(obj, "states", None)
+            s = frozenset(raw) if raw else frozenset()
+        except Exception:
+            s = frozenset()
+        _cache_put(_STATES_CACHE, obj, s)
+    return s
 
 
 def _state_in(obj, st):
-    try:
-        s = getattr(obj, "states", None)
-        return (st in s) if s else False
-    except Exception:
+    if st is None:
         return False
+    return st in _states_of(obj)
 
 
 def _has_state_name(obj, needle):
     """Best-effort state membership test by string name."""
-    try:
-        n = needle.lower()
-        for s in _states_set(obj):
-            if n in _safe(s).lower():
-                return True
-    except Exception:
-        pass
+    n = needle.lower()
+    for s in _states_of(obj):
+        if n in _safe(s).lower():
+            return True
     return False
 
 
-def _iter_children(root, max_nodes=120):
-    """Best-effort BFS over NVDAObject children, capped for safety."""
+def _find_descendant(root, predicate, max_nodes=120):
+    """Best-effort BFS over NVDAObject children, capped for safety.
+
+    Return the first node (root included) whose normalized IA2 attrs satisfy
+    predicate(attrs), or None.
+    """
     if not root:
-        return
+        return None
     seen = set()
-    queue = [root]
-    yielded = 0
-    while queue and yielded < max_nodes:
-        cur = queue.pop(0)
+    queue = deque((root,))
+    # Local bindings for the BFS loop.
+    popleft = queue.popleft
+    append = queue.append
+    seen_add = seen.add
+    ia2_attrs = _ia2_attrs
+    _ga = getattr
+    visited = 0
+    while queue and visited < max_nodes:
+        cur = popleft()
         oid = id(cur)
         if oid in seen:
             continue
-        seen.add(oid)
-        yielded += 1
-        yield cur
+        visited += 1
+        if predicate(ia2_attrs(cur)):
+            return cur
+        seen_add(oid)
         try:
-            child = getattr(cur, "firstChild", None)
+            child = _ga(cur, "firstChild", None)
         except Exception:
             child = None
         steps = 0
         while child and steps < 50:
-            queue.append(child)
+            append(child)
             steps += 1
             try:
-                child = getattr(child, "next", None)
+                child = _ga(child, "next", None)
             except Exception:
                 child = None
+    return None
 
 
-def _dom_chain_with_tags(obj, max_depth=40):
-    """Return [obj, parent, ..., #document] but only nodes that expose IA2 tag."""
+def _is_listbox(attrs):
+    return _lc(attrs, "xml-roles") == "listbox" or _lc(attrs, "role") == "listbox"
+
+
+class _Facts(object):
+    """Values derived once for a DOM chain node.
+
+    tag and cls are stripped and lowercased; href is stripped.
+    """
+
+    __slots__ = ("obj", "attrs", "tag", "cls", "href")
+
+    def __init__(self, obj, attrs):
+        self.obj = obj
+        self.attrs = attrs
+        self.tag = _lc(attrs, "tag")
+        self.cls = _lc(attrs, "class")
+        self.href = _lv(attrs, "href")
+
+
+def _build_facts_chain(obj, max_depth=40):
+    """Return _Facts for [obj, parent, ..., #document], keeping only nodes that expose an IA2 tag."""
     chain = []
+    ia2_attrs = _ia2_attrs
+    _ga = getattr
     cur = obj
     for _ in range(max_depth):
         if not cur:
             break
-        attrs = _ia2_attrs(cur)
+        attrs = ia2_attrs(cur)
         if attrs.get("tag"):
-            chain.append(cur)
-            if attrs.get("tag", "").strip().lower() == "#document":
+            f = _Facts(cur, attrs)
+            chain.append(f)
+            if f.tag == "#document":
                 break
         try:
-            cur = getattr(cur, "parent", None)
+            cur = _ga(cur, "parent", None)
         except Exception:
             cur = None
     return chain
 
 
-def _find_nearest_tag(chain, tag_name):
-    tag_name = (tag_name or "").lower()
-    for o in chain:
-        if _tag(o) == tag_name:
-            return o
-    return None
+def _index_chain(chain):
+    """Map each tag to the nearest (first) entry of chain carrying it."""
+    tag_index = {}
+    for f in chain:
+        if f.tag not in tag_index:
+            tag_index[f.tag] = f
+    return tag_index
 
 
-def _is_contenteditable_host(o):
-    a = _ia2_attrs(o)
-    if _safe(a.get("contenteditable")).lower() in ("true", "1"):
+def _dom_chain_with_tags(obj, max_depth=40):
+    """Return (chain, tag_index) where chain is _build_facts_chain(obj).
+
+    tag_index maps each tag to the nearest chain entry carrying it.
+    Results are cached per object for one inspection; callers must not mutate them.
+    """
+    cached = _CHAIN_CACHE.get(id(obj))
+    if cached is not None and cached[0] == max_depth:
+        return cached[1]
+    chain = _build_facts_chain(obj, max_depth)
+    tag_index = _index_chain(chain)
+    _cache_put(_CHAIN_CACHE, obj, (max_depth, (chain, tag_index)))
+    return chain, tag_index
+
+
+def _is_contenteditable_host(f):
+    a = f.attrs
+    if _lc(a, "contenteditable") in ("true", "1"):
         return True
     if "multiline" in a or "tabindex" in a or a.get("id", "") == "prompt-textarea":
-        return _tag(o) in ("div", "textarea", "section")
+        return f.tag in ("div", "textarea", "section")
     return False
 
 
@@ -395,8 +550,8 @@ def _try_acc_value_url(obj):
         ia = getattr(obj, "IAccessibleObject", None)
         if ia:
             v = ia.accValue(0)
-            v = _safe(v).strip()
-            if v.startswith("http://") or v.startswith("https://"):
+            v = _s(v)
+            if v.startswith(_HTTP_PREFIXES):
                 return v
     except Exception:
         pass
@@ -410,8 +565,8 @@ def _try_tree_interceptor_url(obj):
         if ti:
             for attr in ("documentURL", "URL", "url", "documentConstantIdentifier"):
                 v = getattr(ti, attr, None)
-                v = _safe(v).strip()
-                if v.startswith("http://") or v.startswith("https://"):
+                v = _s(v)
+                if v.startswith(_HTTP_PREFIXES):
                     return v
     except Exception:
         pass
@@ -427,21 +582,20 @@ def _try_appmodule_url(obj):
         for fn_name in ("getBrowserURL", "getCurrentURL", "getCurrentDocumentURL", "getDocumentURL"):
             fn = getattr(am, fn_name, None)
             if callable(fn):
-                v = _safe(fn()).strip()
-                if v.startswith("http://") or v.startswith("https://"):
+                v = _s(fn())
+                if v.startswith(_HTTP_PREFIXES):
                     return v
     except Exception:
         pass
     return ""
 
 
-def _document_url(base_obj, chain):
-    doc = _find_nearest_tag(chain, "#document")
+def _document_url(base_obj, tag_index):
+    doc = tag_index.get("#document")
     if doc:
-        href = _ia2_attrs(doc).get("href", "").strip()
-        if href:
-            return href
-        v = _try_acc_value_url(doc)
+        if doc.href:
+            return doc.href
+        v = _try_acc_value_url(doc.obj)
         if v:
             return v
 
@@ -463,7 +617,7 @@ def _document_url(base_obj, chain):
     return ""
 
 
-def _effective_href(obj, chain, base_obj):
+def _effective_href(obj, tag_index, base_obj):
     """Return the most meaningful href for this element (JAWS-like).
 
     Rules:
@@ -476,16 +630,14 @@ def _effective_href(obj, chain, base_obj):
 
     # #document URL
     if t == "#document":
-        a = _ia2_attrs(obj)
-        href = a.get("href", "").strip()
+        href = _lv(_ia2_attrs(obj), "href")
         if href:
             return href
-        du = _document_url(base_obj, chain)
+        du = _document_url(base_obj, tag_index)
         return du or ""
 
     # Direct href (prefer IA2)
-    a = _ia2_attrs(obj)
-    href = a.get("href", "").strip()
+    href = _lv(_ia2_attrs(obj), "href")
     if href:
         return href
 
@@ -499,13 +651,11 @@ def _effective_href(obj, chain, base_obj):
 
     # Only inherit href for nested media inside a link
     if t in ("img", "svg"):
-        link = _find_nearest_tag(chain, "a")
+        link = tag_index.get("a")
         if link:
-            a2 = _ia2_attrs(link)
-            href2 = a2.get("href", "").strip()
-            if href2:
-                return href2
-            v2 = _try_acc_value_url(link)
+            if link.href:
+                return link.href
+            v2 = _try_acc_value_url(link.obj)
             if v2:
                 return v2
 
@@ -517,7 +667,7 @@ def _effective_href(obj, chain, base_obj):
 
 # -----------------------------
 
-def _promote_canonical(obj, chain):
+def _promote_canonical(obj, chain, tag_index):
     """Promote nested nodes to a more meaningful, JAWS-like 'canonical' element."""
     if not obj or not chain:
         return _prefer_interactive_container(obj), None
@@ -525,14 +675,14 @@ def _promote_canonical(obj, chain):
     cur_tag = _tag(obj)
 
     if cur_tag in ("img", "svg"):
-        link = _find_nearest_tag(chain, "a")
+        link = tag_index.get("a")
         if link:
-            return link, obj
+            return link.obj, obj
 
     if cur_tag in ("p", "span", "br"):
-        for o in chain:
-            if _is_contenteditable_host(o):
-                return _prefer_interactive_container(o), obj
+        for f in chain:
+            if _is_contenteditable_host(f):
+                return _prefer_interactive_container(f.obj), obj
 
     return _prefer_interactive_container(obj), None
 
@@ -541,47 +691,42 @@ def _promote_canonical(obj, chain):
 # Formatting (JAWS-like, readable)
 # -----------------------------
 
+_PREFERRED_KEYS = (
+    "tag", "id", "class",
+    "role", "xml-roles",
+    "orientation",
+    "MSAA Role",
+    "IA2 Role",
+    "href", "src",
+    "type", "text-input-type",
+    "name", "html-input-name",
+    "accessible-name", "accessible-name-from",
+    "formcontrolname",
+    "value", "valuetext",
+    "required", "multiline",
+    "contenteditable", "tabindex",
+    "maxlength", "autocomplete",
+    "haspopup", "expanded",
+    "selected",
+    "checkable", "checked",
+    "pressed",
+    "label", "title",
+    "describedby", "description",
+    "description-from", "labelledby",
+    "name-from", "explicit-name", "explicit-name-from",
+    "level", "posinset", "setsize",
+    "colspan", "rowspan", "table-cell-index",
+    "readonly", "fsFormField",
+    "display", "layout-guess", "text-align", "text-model",
+)
+_PREFERRED_INDEX = {k: i for i, k in enumerate(_PREFERRED_KEYS)}
+
+
 def _ordered_params(tag_name, attrs):
+    """Preferred keys first (in _PREFERRED_KEYS order), then the rest alphabetically."""
     attrs = attrs or {}
-    preferred = [
-        "tag", "id", "class",
-        "role", "xml-roles",
-        "orientation",
-        "MSAA Role",
-        "IA2 Role",
-        "href", "src",
-        "type", "text-input-type",
-        "name", "html-input-name",
-        "accessible-name", "accessible-name-from",
-        "formcontrolname",
-        "value", "valuetext",
-        "required", "multiline",
-        "contenteditable", "tabindex",
-        "maxlength", "autocomplete",
-        "haspopup", "expanded",
-        "selected",
-        "checkable", "checked",
-        "pressed",
-        "label", "title",
-        "describedby", "description",
-        "description-from", "labelledby",
-        "name-from", "explicit-name", "explicit-name-from",
-        "level", "posinset", "setsize",
-        "colspan", "rowspan", "table-cell-index",
-        "readonly", "fsFormField",
-        "display", "layout-guess", "text-align", "text-model",
-    ]
-    seen = set()
-    keys = []
-    for k in preferred:
-        if k in attrs and k not in seen:
-            keys.append(k)
-            seen.add(k)
-    for k in sorted(attrs.keys(), key=lambda s: s.lower()):
-        if k not in seen:
-            keys.append(k)
-            seen.add(k)
-    return keys
+    n = len(_PREFERRED_KEYS)
+    return sorted(attrs.keys(), key=lambda k: (_PREFERRED_INDEX.get(k, n), k.lower()))
 
 
 def _infer_form_attrs(obj, attrs):
@@ -589,41 +734,29 @@ def _infer_form_attrs(obj, attrs):
 
     # Normalize checked from IA2 attrs when present (JAWS-like true/false).
     if "checked" in out:
-        v = _safe(out.get("checked", "")).strip().lower()
+        v = _lc(out, "checked")
         if v in ("1", "true", "yes", "on", "mixed"):
             out["checked"] = "true"
         elif v in ("0", "false", "no", "off"):
             out["checked"] = "false"
 
 
+    # Lowercased once; nothing below rewrites these keys.
+    df = _lc(out, "description-from")
+
     # Tooltip/title should not be reported as label. Keep JAWS-like: title=... + description-from=tooltip.
-    try:
-        src = _safe(out.get("description-from", "")).strip().lower()
-        if src == "tooltip" and "label" in out and "title" not in out:
-            out["title"] = out.pop("label")
-    except Exception:
-        pass
+    if df == "tooltip" and "label" in out and "title" not in out:
+        out["title"] = out.pop("label")
     t = (out.get("tag") or _tag(obj)).lower()
 
     # Never mark non-controls as form fields.
-    if t in ("#document", "body", "html"):
+    if t in _DOC_TAGS:
         out.pop("fsFormField", None)
 
     # Infer basic form-field marker similar to JAWS (best-effort).
     # JAWS often reports fsFormField=true for interactive controls.
     if "fsFormField" not in out:
-        try:
-            xmlr = _safe(out.get("xml-roles", "")).lower()
-            r = _safe(out.get("role", "")).lower()
-        except Exception:
-            xmlr = ""
-            r = ""
-        interactive_tags = {"input", "textarea", "select", "button"}
-        interactive_roles = {
-            "button", "checkbox", "radio", "combobox", "listbox", "textbox", "searchbox",
-            "slider", "spinbutton", "menuitem", "option", "switch", "tab", "treeitem",
-        }
-        if (t in interactive_tags) or (r in interactive_roles) or (xmlr in interactive_roles):
+        if (t in _INTERACTIVE_TAGS) or (_lc(out, "role") in _INTERACTIVE_ROLES) or (_lc(out, "xml-roles") in _INTERACTIVE_ROLES):
             out["fsFormField"] = "true"
 
     if t in ("input", "textarea") and "type" not in out:
@@ -642,25 +775,24 @@ def _infer_form_attrs(obj, attrs):
             out["multiline"] = "false"
 
     if "required" not in out:
-        if _state_in(obj, controlTypes.State.REQUIRED) or _has_state_name(obj, "required"):
+        if _state_in(obj, _S_REQUIRED) or _has_state_name(obj, "required"):
             out["required"] = "true"
 
     if "label" not in out:
         # Prefer an explicit label/name when the backend reports that the
         # accessible name comes from an attribute (common on modern web apps).
         try:
-            nm = _safe(getattr(obj, "name", "")).strip()
+            nm = _s(getattr(obj, "name", ""))
         except Exception:
             nm = ""
-        if nm and _safe(out.get("name-from", "")).lower() == "attribute":
+        if nm and _lc(out, "name-from") == "attribute":
             out["label"] = nm
         else:
             try:
-                desc = _safe(getattr(obj, "description", "")).strip()
+                desc = _s(getattr(obj, "description", ""))
             except Exception:
                 desc = ""
             if desc:
-                df = _safe(out.get("description-from", "")).lower()
                 if df == "aria-describedby":
                     out["description"] = desc
                 elif df == "tooltip":
@@ -671,11 +803,16 @@ def _infer_form_attrs(obj, attrs):
     return out
 
 
-def _infer_expanded_for_combobox(obj, chain, attrs):
+# Lowercased class markers of Google's search combobox container.
+_GOOGLE_COMBO_CLASS = "a8sbwf"
+_GOOGLE_COMBO_OPEN_CLASS = "emcav"
+
+
+def _infer_expanded_for_combobox(obj, chain, tag_index, attrs):
     out = dict(attrs or {})
-    xml_roles = _safe(out.get("xml-roles", "")).lower()
-    role = _safe(out.get("role", "")).lower()
-    haspopup = _safe(out.get("haspopup", "")).lower()
+    xml_roles = _lc(out, "xml-roles")
+    role = _lc(out, "role")
+    haspopup = _lc(out, "haspopup")
 
     is_combo = ("combobox" in xml_roles) or (role == "combobox") or (haspopup == "listbox")
     if not is_combo:
@@ -686,67 +823,105 @@ def _infer_expanded_for_combobox(obj, chain, attrs):
         return out
 
     # Google-style hint: container class includes 'emcav' when suggestions are open.
-    for o in chain:
-        a = _ia2_attrs(o)
-        cls = _safe(a.get("class", "")).lower()
-        if "a8sbwf" in cls and "emcav" in cls:
-            out["expanded"] = "true"
-            return out
-
-    # Choose a broader container to search for a listbox.
-    # Prefer the known Google container (A8SBwf) when present; otherwise first ancestor div.
+    # The same pass picks the container to search for a listbox: prefer the
+    # known Google container (A8SBwf) when present; otherwise first ancestor div.
     start = None
-    for o in chain:
-        a = _ia2_attrs(o)
-        if _tag(o) == "div" and "a8sbwf" in _safe(a.get("class", "")).lower():
-            start = o
-            break
-    if start is None:
-        for o in chain:
-            if _tag(o) == "div":
-                start = o
-                break
+    for f in chain:
+        if _GOOGLE_COMBO_CLASS in f.cls:
+            if _GOOGLE_COMBO_OPEN_CLASS in f.cls:
+                out["expanded"] = "true"
+                return out
+            if start is None and f.tag == "div":
+                start = f.obj
     if start is None:
-        start = obj
-
-    found_listbox = False
-    for node in _iter_children(start, max_nodes=260):
-        a = _ia2_attrs(node)
-        xr = _safe(a.get("xml-roles", "")).lower()
-        r = _safe(a.get("role", "")).lower()
-        if xr == "listbox" or r == "listbox":
-            found_listbox = True
-            break
+        f = tag_index.get("div")
+        start = f.obj if f else obj
 
+    found_listbox = _find_descendant(start, _is_listbox, max_nodes=260) is not None
     out["expanded"] = "true" if found_listbox else "false"
     return out
 
 
-def _augment_attrs_for_readability(obj, chain, attrs, base_obj):
+def _fix_cell(obj, out, states, hasStateName):
+    """td/th: always report colspan/rowspan, defaulting to 1."""
+    if "colspan" not in out:
+        try:
+            v = getattr(obj, "colSpan", None) or getattr(obj, "colspan", None)
+            out["colspan"] = _safe(v) if v else "1"
+        except Exception:
+            out["colspan"] = "1"
+    if "rowspan" not in out:
+        try:
+            v = getattr(obj, "rowSpan", None) or getattr(obj, "rowspan", None)
+            out["rowspan"] = _safe(v) if v else "1"
+        except Exception:
+            out["rowspan"] = "1"
+
+
+def _fix_table(obj, out, states, hasStateName):
+    if "layout-guess" not in out:
+        out["layout-guess"] = "false"
+
+
+def _fix_tab_role(obj, out, states, hasStateName):
+    """role=tab: expose implicit tabindex=0 when focusable/focused (roving tabindex patterns).
+
+    tabindex is otherwise reported only when explicitly exposed. Do NOT infer it for
+    general elements, because many modern web apps (e.g. Google Docs) use roving
+    tabindex and programmatic focus that is not reliably exposed via IA2 attributes.
+    """
+    if "tabindex" in out or _lc(out, "tag") in _DOC_TAGS:
+        return
+    is_focusable = _S_FOCUSABLE in states or hasStateName("focusable")
+    is_focused = _S_FOCUSED in states or hasStateName("focused")
+    if is_focusable or is_focused:
+        out["tabindex"] = "0"
+
+
+_TAG_HANDLERS = {
+    "td": _fix_cell,
+    "th": _fix_cell,
+    "table": _fix_table,
+}
+
+_ROLE_HANDLERS = {
+    "tab": _fix_tab_role,
+}
+
+
+def _augment_attrs_for_readability(obj, chain, tag_index, attrs, base_obj):
     out = dict(attrs or {})
 
-    t = _tag(obj)
-    if t and "tag" not in out:
-        out["tag"] = t
+    # attrs comes from _ia2_attrs(obj), which already carries the (interned) tag.
+    tagLower = _lc(out, "tag")
+    roleLower = _lc(out, "role")
+    xmlRoleLower = _lc(out, "xml-roles")
+
+    # Snapshot raw IA2 attributes and states once; the blocks below only read these.
+    try:
+        ia2n = getattr(obj, "IA2Attributes", None) or {}
+    except Exception:
+        ia2n = {}
+    states = _states_of(obj)
+    stateNames = tuple(_safe(st).lower() for st in states)
+
+    def hasStateName(needle):
+        return any(needle in n for n in stateNames)
 
     # Accessible name (the final name NVDA speaks) + its likely source.
     # This is useful for evaluators who see NVDA announce something that is hard
     # to locate in the DOM.
     if "accessible-name" not in out:
         try:
-            out["accessible-name"] = _safe(getattr(obj, "name", "")).strip()
+            out["accessible-name"] = _s(getattr(obj, "name", ""))
         except Exception:
             out["accessible-name"] = ""
 
     # Where the accessible name likely comes from (best-effort refinement).
-    try:
-        ia2n = getattr(obj, "IA2Attributes", None) or {}
-    except Exception:
-        ia2n = {}
     nf = ia2n.get("name-from") or out.get("name-from") or ""
     lb = ia2n.get("label") or out.get("label") or ""
 
-    computedFrom = _safe(nf).strip()
+    computedFrom = intern(_s(nf))
 
     # Conservative refinement: only specialize when we have direct evidence.
     # NVDA/IA2 often only reports name-from=attribute without exposing which attribute.
@@ -776,79 +951,45 @@ def _augment_attrs_for_readability(obj, chain, attrs, base_obj):
             out["accessible-name-from"] = computedFrom
 
     # If NVDA flags an explicit-name, expose its source (without duplicating the name value).
-    try:
-        exp = _safe(out.get("explicit-name", "")).strip().lower()
-    except Exception:
-        exp = ""
+    exp = _lc(out, "explicit-name")
     if exp in ("true", "1", "yes", "on"):
-        if "explicit-name-from" not in out or not _safe(out.get("explicit-name-from", "")).strip():
+        if "explicit-name-from" not in out or not _lv(out, "explicit-name-from"):
             out["explicit-name-from"] = computedFrom
 
     # Expanded / collapsed (prefer real NVDA states when available)
-    if _state_in(obj, controlTypes.State.COLLAPSED) or _has_state_name(obj, "collapsed"):
+    if _S_COLLAPSED in states or hasStateName("collapsed"):
         out["expanded"] = "false"
-    elif _state_in(obj, controlTypes.State.EXPANDED) or _has_state_name(obj, "expanded"):
+    elif _S_EXPANDED in states or hasStateName("expanded"):
         out["expanded"] = "true"
 
     # Selected state (high-signal for tabs, options, treeitems, etc.).
     if "selected" not in out:
-        try:
-            if _state_in(obj, controlTypes.State.SELECTED) or _has_state_name(obj, "selected"):
-                out["selected"] = "true"
-            else:
-                # Only report selected=false when the role meaningfully supports selection.
-                try:
-                    roleLower = _safe(out.get("role", "")).lower()
-                    xmlRoleLower = _safe(out.get("xml-roles", "")).lower()
-                except Exception:
-                    roleLower = ""
-                    xmlRoleLower = ""
-                if roleLower in ("tab", "option", "treeitem") or xmlRoleLower in ("tab", "option", "treeitem"):
-                    out["selected"] = "false"
-        except Exception:
-            pass
+        if _S_SELECTED in states or hasStateName("selected"):
+            out["selected"] = "true"
+        else:
+            # Only report selected=false when the role meaningfully supports selection.
+            if roleLower in _SELECTABLE_ROLES or xmlRoleLower in _SELECTABLE_ROLES:
+                out["selected"] = "false"
 
     
     # Checkable/checked (switch/checkbox-like): If IA2 reports checkable, also report checked state.
     # Keep minimal and prefer NVDA states.
     if "checkable" in out and "checked" not in out:
-        try:
-            roleLower = _safe(out.get("role", "")).lower()
-            xmlRoleLower = _safe(out.get("xml-roles", "")).lower()
-        except Exception:
-            roleLower = ""
-            xmlRoleLower = ""
         stChecked = False
 
         # Switch: NVDA often exposes on/off via state name, not CHECKED.
         if roleLower == "switch" or xmlRoleLower == "switch":
-            try:
-                if _has_state_name(obj, "on"):
-                    stChecked = True
-                elif _has_state_name(obj, "off"):
-                    stChecked = False
-            except Exception:
-                pass
-            if not stChecked:
-                try:
-                    stOn = getattr(getattr(controlTypes, "State", None), "ON", None)
-                    if stOn is not None and _state_in(obj, stOn):
-                        stChecked = True
-                except Exception:
-                    pass
+            if hasStateName("on"):
+                stChecked = True
+            if not stChecked and _S_ON in states:
+                stChecked = True
 
         if not stChecked:
-            try:
-                stChecked = _state_in(obj, controlTypes.State.CHECKED) or _has_state_name(obj, "checked")
-            except Exception:
-                stChecked = False
+            stChecked = _S_CHECKED in states or hasStateName("checked")
 
         # Fallback: some toggles surface as PRESSED.
         if not stChecked and (roleLower == "switch" or xmlRoleLower == "switch"):
-            try:
-                stChecked = _state_in(obj, controlTypes.State.PRESSED) or _has_state_name(obj, "pressed")
-            except Exception:
-                stChecked = False
+            stChecked = _S_PRESSED in states or hasStateName("pressed")
 
         out["checked"] = "true" if stChecked else "false"
 
@@ -860,46 +1001,27 @@ def _augment_attrs_for_readability(obj, chain, attrs, base_obj):
     # visual/speech state. Prefer NVDA states when they indicate a pressed/
     # checked condition, but avoid inventing a pressed value for normal buttons.
     pressedFromAria = None
-    ap = _safe(out.get("aria-pressed", "")).strip().lower()
+    ap = _lc(out, "aria-pressed")
     if ap:
-        if ap in ("0", "false", "no"):
-            pressedFromAria = False
-        elif ap in ("1", "true", "yes"):
-            pressedFromAria = True
+        pm = _PRESSED_MAP.get(ap)
+        if pm is not None:
+            pressedFromAria = pm == "true"
         # Keep reports JAWS-like: don't show aria-pressed separately.
         out.pop("aria-pressed", None)
     if "pressed" not in out:
         # Fallback: NVDA states, but only when the role/tag strongly suggests a toggle.
-        try:
-            tagLower = _safe(out.get("tag", "")).lower()
-        except Exception:
-            tagLower = ""
-        try:
-            roleLower = _safe(out.get("role", "")).lower()
-            xmlRoleLower = _safe(out.get("xml-roles", "")).lower()
-        except Exception:
-            roleLower = ""
-            xmlRoleLower = ""
         is_toggle = (roleLower == "togglebutton") or (xmlRoleLower == "togglebutton")
-        try:
-            Role = getattr(controlTypes, "Role", None)
-            if Role and not is_toggle:
-                tb = getattr(Role, "TOGGLEBUTTON", None)
-                if tb is not None and getattr(obj, "role", None) == tb:
-                    is_toggle = True
-        except Exception:
-            pass
-        if is_toggle and (tagLower in ("button", "a", "div", "span") or tagLower == ""):
-            # Prefer explicit NVDA state flags when present.
-            try:
-                stPressed = _state_in(obj, controlTypes.State.PRESSED)
-            except Exception:
-                stPressed = False
+        if not is_toggle and _R_TOGGLE is not None:
+            # obj.role is a live NVDAObject property; a COM failure means "not a toggle".
             try:
-                stChecked = _state_in(obj, controlTypes.State.CHECKED)
+                is_toggle = getattr(obj, "role", None) == _R_TOGGLE
             except Exception:
-                stChecked = False
-            if stPressed or stChecked or _has_state_name(obj, "pressed") or _has_state_name(obj, "checked"):
+                is_toggle = False
+        if is_toggle and tagLower in _TOGGLE_TAGS:
+            # Prefer explicit NVDA state flags when present.
+            stPressed = _S_PRESSED in states
+            stChecked = _S_CHECKED in states
+            if stPressed or stChecked or hasStateName("pressed") or hasStateName("checked"):
                 out["pressed"] = "true"
             elif pressedFromAria is not None:
                 out["pressed"] = "true" if pressedFromAria else "false"
@@ -908,12 +1030,6 @@ def _augment_attrs_for_readability(obj, chain, attrs, base_obj):
 
     # Tabs: JAWS often reports pressed=true for the active tab.
     if "pressed" not in out:
-        try:
-            roleLower = _safe(out.get("role", "")).lower()
-            xmlRoleLower = _safe(out.get("xml-roles", "")).lower()
-        except Exception:
-            roleLower = ""
-            xmlRoleLower = ""
         if roleLower == "tab" or xmlRoleLower == "tab":
             if out.get("selected") == "true":
                 out["pressed"] = "true"
@@ -926,108 +1042,44 @@ def _augment_attrs_for_readability(obj, chain, attrs, base_obj):
 
     # Normalize pressed when present.
     if "pressed" in out:
-        try:
-            pv = _safe(out.get("pressed", "")).strip().lower()
-            if pv in ("0", "false", "no"):
-                out["pressed"] = "false"
-            elif pv in ("1", "true", "yes"):
-                out["pressed"] = "true"
-        except Exception:
-            pass
-    if t in ("td","th"):
-        if "colspan" not in out:
-            try:
-                v = getattr(obj, "colSpan", None) or getattr(obj, "colspan", None)
-                out["colspan"] = _safe(v) if v else "1"
-            except Exception:
-                out["colspan"] = "1"
-        if "rowspan" not in out:
-            try:
-                v = getattr(obj, "rowSpan", None) or getattr(obj, "rowspan", None)
-                out["rowspan"] = _safe(v) if v else "1"
-            except Exception:
-                out["rowspan"] = "1"
-    if t == "table" and "layout-guess" not in out:
-        out["layout-guess"] = "false"
-
-    # tabindex: report only when explicitly exposed.
-    # Do NOT infer tabindex for general elements, because many modern web apps (e.g. Google Docs)
-    # use roving tabindex and programmatic focus that is not reliably exposed via IA2 attributes.
-    # Exception: role=tab (roving tabindex patterns). For tabs, expose implicit tabindex=0 when focusable/focused.
-    if "tabindex" not in out:
-        try:
-            tagLower = (out.get("tag") or _tag(obj) or "").lower()
-        except Exception:
-            tagLower = ""
-        if tagLower not in ("#document", "body", "html"):
-            try:
-                roleLower = _safe(out.get("role", "")).lower()
-                xmlRoleLower = _safe(out.get("xml-roles", "")).lower()
-            except Exception:
-                roleLower = ""
-                xmlRoleLower = ""
-            if roleLower == "tab" or xmlRoleLower == "tab":
-                try:
-                    is_focusable = _state_in(obj, controlTypes.State.FOCUSABLE) or _has_state_name(obj, "focusable")
-                    is_focused = _state_in(obj, controlTypes.State.FOCUSED) or _has_state_name(obj, "focused")
-                except Exception:
-                    is_focusable = False
-                    is_focused = False
-                if is_focusable or is_focused:
-                    out["tabindex"] = "0"
+        pm = _PRESSED_MAP.get(_lc(out, "pressed"))
+        if pm is not None:
+            out["pressed"] = pm
+    # Tag/role specific normalization: each element hits at most one handler per table.
+    h = _TAG_HANDLERS.get(tagLower)
+    if h:
+        h(obj, out, states, hasStateName)
+    h = _ROLE_HANDLERS.get(roleLower) or _ROLE_HANDLERS.get(xmlRoleLower)
+    if h:
+        h(obj, out, states, hasStateName)
 
 # _infer_form_attrs returns an updated dict; do not treat it like a callable.
     out = _infer_form_attrs(obj, out)
-    out = _infer_expanded_for_combobox(obj, chain, out)
+    out = _infer_expanded_for_combobox(obj, chain, tag_index, out)
 
     
     # Safety: never show MSAA Role for non-control wrapper tags in the user report.
-    try:
-        _tL = _safe(out.get("tag", "")).strip().lower()
-        if "MSAA Role" in out and not _is_control_tag(_tL):
-            out.pop("MSAA Role", None)
-    except Exception:
-        pass
+    if "MSAA Role" in out and not _is_control_tag(tagLower):
+        out.pop("MSAA Role", None)
 
     # Read-only on #document is noise; don't report it.
-    try:
-        if _safe(out.get("tag", "")).strip().lower() == "#document":
-            out.pop("readonly", None)
-    except Exception:
-        pass
+    if tagLower == "#document":
+        out.pop("readonly", None)
 
 # Clarify NVDA-computed description vs. attribute provenance.
     # If description came from aria-describedby, present it as describedby-text (JAWS-like) while keeping 'description-from'.
-    try:
-        df = _safe(out.get("description-from", "")).strip().lower()
-        desc = _safe(out.get("description", "")).strip()
-        if df == "aria-describedby" and desc:
-            if "describedby-text" not in out:
-                out["describedby-text"] = desc
-    except Exception:
-        pass
+    df = _lc(out, "description-from")
+    desc = _lv(out, "description")
+    if df == "aria-describedby" and desc:
+        if "describedby-text" not in out:
+            out["describedby-text"] = desc
 
 
     # ---- DEBUG: Tabindex provenance ----
     if DEBUG_MODE:
         try:
-            raw_tab = None
-            try:
-                ia2 = getattr(obj, "IA2Attributes", None) or {}
-                raw_tab = ia2.get("tabindex")
-            except Exception:
-                raw_tab = None
-
-            final_tab = out.get("tabindex")
-            states = []
-            try:
-                st = getattr(obj, "states", [])
-                states = list(st) if isinstance(st, (set, list, tuple)) else [st]
-            except Exception:
-                pass
-
-            _dbg(f"[TABINDEX DEBUG] tag={_safe(out.get('tag',''))} raw_ia2={raw_tab} final_reported={final_tab}")
-            _dbg(f"[TABINDEX DEBUG] states={states}")
+            _dbg("[TABINDEX DEBUG] tag=%s raw_ia2=%s final_reported=%s", _safe(out.get("tag", "")), ia2n.get("tabindex"), out.get("tabindex"))
+            _dbg("[TABINDEX DEBUG] states=%s", list(states))
         except Exception:
             pass
 
@@ -1037,413 +1089,356 @@ def _augment_attrs_for_readability(obj, chain, attrs, base_obj):
 
 def _is_control_tag(tagLower):
     """Return True for HTML tags where MSAA accRole is usually meaningful."""
-    if not tagLower:
-        return False
-    return tagLower in ("input", "textarea", "select", "button", "option", "meter", "progress")
+    return bool(tagLower) and tagLower in _CONTROL_TAGS
 
-def _is_web_context(base_obj):
-    """Return True when inspection is meaningful.
+_BMClass = getattr(browseMode, "BrowseModeTreeInterceptor", None)
 
-    Priority: NVDA Browse Mode (virtual buffer) — works in browsers AND apps like Thunderbird.
-    Secondary: IA2 #document tag or retrievable document URL (some backends expose these).
-    """
-    if not base_obj:
-        return False
 
-    def _is_browse_mode_obj(o):
-        try:
-            ti = getattr(o, "treeInterceptor", None)
-        except Exception:
-            ti = None
+def _is_browse_mode_obj(o):
+    """True when o's tree interceptor is a browse mode (virtual buffer) one."""
+    try:
+        ti = getattr(o, "treeInterceptor", None)
         if not ti:
             return False
         # Most reliable: is a BrowseModeTreeInterceptor
-        try:
-            if isinstance(ti, browseMode.BrowseModeTreeInterceptor):
-                return True
-        except Exception:
-            pass
+        if _BMClass is not None and isinstance(ti, _BMClass):
+            return True
         # Best-effort fallback: common browse mode properties
-        try:
-            if hasattr(ti, "passThrough") and hasattr(ti, "script_quickNav_nextHeading"):
-                return True
-        except Exception:
-            pass
+        return hasattr(ti, "passThrough") and hasattr(ti, "script_quickNav_nextHeading")
+    except Exception:
         return False
 
+
+def _web_context(base_obj):
+    """Return (ok, base_dom) telling whether inspection is meaningful.
+
+    Priority: NVDA Browse Mode (virtual buffer) — works in browsers AND apps like Thunderbird.
+    Secondary: IA2 #document tag or retrievable document URL (some backends expose these).
+    base_dom is the (chain, tag_index) pair of base_obj when it had to be walked here,
+    or None when the browse mode check answered without walking the chain.
+    """
+    if not base_obj:
+        return False, None
+
     # 1) Browse mode check (navigator OR focus)
-    try:
-        if _is_browse_mode_obj(base_obj):
-            return True
-    except Exception:
-        pass
+    if _is_browse_mode_obj(base_obj):
+        return True, None
 
     try:
         focus = api.getFocusObject()
     except Exception:
         focus = None
-    if focus and focus is not base_obj:
-        try:
-            if _is_browse_mode_obj(focus):
-                return True
-        except Exception:
-            pass
+    if focus and focus is not base_obj and _is_browse_mode_obj(focus):
+        return True, None
 
-    # 2) IA2 tag chain ending in #document
+    # 2) IA2 tag chain ending in #document (walked once, handed back to the caller)
     try:
-        base_chain = _dom_chain_with_tags(base_obj)
+        base_dom = _dom_chain_with_tags(base_obj)
     except Exception:
-        base_chain = []
-    try:
-        for o in base_chain:
-            if _tag(o) == "#document":
-                return True
-    except Exception:
-        pass
+        base_dom = ([], {})
+    base_index = base_dom[1]
+    if "#document" in base_index:
+        return True, base_dom
 
     # 3) Fallback: retrievable document URL
     try:
-        du = _document_url(base_obj, base_chain)
+        du = _document_url(base_obj, base_index)
         if du:
-            return True
+            return True, base_dom
     except Exception:
         pass
 
     if focus and focus is not base_obj:
         try:
-            focus_chain = _dom_chain_with_tags(focus)
+            _, focus_index = _dom_chain_with_tags(focus)
         except Exception:
-            focus_chain = []
+            focus_index = {}
+        if "#document" in focus_index:
+            return True, base_dom
         try:
-            for o in focus_chain:
-                if _tag(o) == "#document":
-                    return True
-        except Exception:
-            pass
-        try:
-            du = _document_url(focus, focus_chain)
+            du = _document_url(focus, focus_index)
             if du:
-                return True
+                return True, base_dom
         except Exception:
             pass
 
-    return False
+    return False, None
+
 
+def _format_tag_block(tag_name, attrs, out_lines, stripped=False):
+    """Append the "Tag X has N parameters:" header and key=value lines to out_lines.
 
-def _format_tag_block(tag_name, attrs):
+    stripped=True promises every value is already a stripped str, skipping per-value normalization.
+    """
     keys = _ordered_params(tag_name, attrs)
-    out_lines = []
-    out_lines.append("")  # blank line BEFORE the header
     # Skip empty values to reduce noise (e.g., accessible-name= on containers).
-    pairs = []
-    for k in keys:
-        v = _safe((attrs or {}).get(k, "")).strip()
-        if v == "":
-            continue
-        pairs.append((k, v))
+    if stripped:
+        pairs = [(k, attrs[k]) for k in keys if attrs[k]]
+    else:
+        pairs = []
+        for k in keys:
+            v = _safe((attrs or {}).get(k, "")).strip()
+            if v == "":
+                continue
+            pairs.append((k, v))
     out_lines.append(f"Tag {tag_name.upper()} has {len(pairs)} parameters:")
     for k, v in pairs:
         out_lines.append(f"{k}={v}")
-    out_lines.append("")  # blank line after each block
-    return "\n".join(out_lines)
 
 
 
+_ESC = html.escape
+
+
+def _write_line(buf, text):
+    """Write text to buf, newline-separated from anything already written."""
+    if buf.tell():
+        buf.write("\n")
+    buf.write(text)
+
+
+# Attributes kept for child elements in the advanced report.
+_CHILD_KEEP_KEYS = (
+    "tag", "id", "role", "xml-roles", "href", "src", "type", "accessible-name", "accessible-name-from",
+    "explicit-name", "explicit-name-from",
+    "pressed", "expanded", "selected", "checked", "value", "valuetext",
+)
+
+
 def _build_report(advanced=False):
+    # Caches live for one inspection only; never keep NVDAObjects (and their
+    # COM pointers) alive between keypresses.
+    try:
+        return _build_report_impl(advanced)
+    finally:
+        _clear_caches()
+
+
+def _build_report_impl(advanced):
     base = _get_candidate_object()
     if not base:
         return _("No element found."), False
 
     # Gate: only run in HTML/virtual-buffer contexts.
-    if not _is_web_context(base):
+    ok, base_dom = _web_context(base)
+    if not ok:
         return _("HTML Element Inspector works only when Browse Mode (virtual buffer) is available."), False
 
-    base_chain = _dom_chain_with_tags(base)
+    base_chain, base_index = base_dom if base_dom is not None else _dom_chain_with_tags(base)
     # Fallback: if we only got #document, try other common candidates.
     # This fixes cases where the navigator object becomes a document-level node
     # after an initial inspection dialog.
-    if len(base_chain) == 1 and _tag(base_chain[0]) == "#document":
+    if len(base_chain) == 1 and base_chain[0].tag == "#document":
         alt = None
         try:
             alt = api.getNavigatorObject()
         except Exception:
             alt = None
         if alt and alt is not base:
-            alt_chain = _dom_chain_with_tags(alt)
+            alt_chain, alt_index = _dom_chain_with_tags(alt)
             if len(alt_chain) > len(base_chain):
                 base = alt
-                base_chain = alt_chain
-        if len(base_chain) == 1 and _tag(base_chain[0]) == "#document":
+                base_chain, base_index = alt_chain, alt_index
+        if len(base_chain) == 1 and base_chain[0].tag == "#document":
             try:
                 alt = api.getFocusObject()
             except Exception:
                 alt = None
             if alt and alt is not base:
-                alt_chain = _dom_chain_with_tags(alt)
+                alt_chain, alt_index = _dom_chain_with_tags(alt)
                 if len(alt_chain) > len(base_chain):
                     base = alt
-                    base_chain = alt_chain
-    canonical, promoted_from = _promote_canonical(base, base_chain)
-    _dbg("---- INSPECTION START ----")
-    _dbg_obj(base, "BASE")
-    _dbg(f"Base object: {base}")
-    _dbg(f"Base chain tags: {[ _tag(o) for o in base_chain ]}")
-    _dbg(f"Canonical object: {canonical}")
-    _dbg_obj(canonical, "CANONICAL")
-    _dbg(f"Promoted from: {promoted_from}")
-    if promoted_from:
-        _dbg_obj(promoted_from, "PROMOTED_FROM")
-    canonical_chain = _dom_chain_with_tags(canonical)
-
-    lines = []
-    lines.append("Advanced Element Information:" if advanced else "Element Information:")
+                    base_chain, base_index = alt_chain, alt_index
+    canonical, promoted_from = _promote_canonical(base, base_chain, base_index)
+    if DEBUG_MODE:
+        _dbg("---- INSPECTION START ----")
+        _dbg_obj(base, "BASE")
+        _dbg("Base object: %s", base)
+        _dbg("Base chain tags: %s", [f.tag for f in base_chain])
+        _dbg("Canonical object: %s", canonical)
+        _dbg_obj(canonical, "CANONICAL")
+        _dbg("Promoted from: %s", promoted_from)
+        if promoted_from:
+            _dbg_obj(promoted_from, "PROMOTED_FROM")
+    canonical_chain, canonical_index = _dom_chain_with_tags(canonical)
+
+    # (TAG, [header, key=value, ...]) per block, rendered as HTML below.
+    tag_blocks = []
+
+    def _add_block(tag_name, attrs):
+        block_lines = []
+        _format_tag_block(tag_name, attrs, block_lines)
+        tag_blocks.append((tag_name.upper(), block_lines))
 
     c_raw = _ia2_attrs(canonical)
-    _dbg(f"Canonical IA2 raw attrs: {c_raw}")
-    try:
-        _dbg(f"Computed description (canonical.description): {getattr(canonical, 'description', None)}")
-    except Exception:
-        pass
-    try:
-        ia2 = getattr(canonical, 'IA2Attributes', None) or {}
-        for k in ('aria-describedby', 'describedby', 'describedBy', 'describedby-text', 'description-from'):
-            if k in ia2:
-                _dbg(f"Canonical IA2 {k}: {ia2.get(k)}")
-    except Exception:
-        pass
-    try:
-        _dbg(f"Canonical NVDA role: {getattr(canonical, 'role', None)}")
-    except Exception:
-        pass
-    c_attrs = _augment_attrs_for_readability(canonical, canonical_chain, c_raw, base)
+    if DEBUG_MODE:
+        _dbg("Canonical IA2 raw attrs: %s", c_raw)
+        try:
+            _dbg("Computed description (canonical.description): %s", getattr(canonical, "description", None))
+        except Exception:
+            pass
+        try:
+            ia2 = getattr(canonical, "IA2Attributes", None) or {}
+            for k in ("aria-describedby", "describedby", "describedBy", "describedby-text", "description-from"):
+                if k in ia2:
+                    _dbg("Canonical IA2 %s: %s", k, ia2.get(k))
+        except Exception:
+            pass
+        try:
+            _dbg("Canonical NVDA role: %s", getattr(canonical, "role", None))
+        except Exception:
+            pass
+    c_attrs = _augment_attrs_for_readability(canonical, canonical_chain, canonical_index, c_raw, base)
     c_tag = c_attrs.get("tag", _tag(canonical)) or "unknown"
-    lines.append(_format_tag_block(c_tag, c_attrs).rstrip())
+    _add_block(c_tag, c_attrs)
 
     if promoted_from and promoted_from is not canonical:
-        p_chain = _dom_chain_with_tags(promoted_from)
+        p_chain, p_index = _dom_chain_with_tags(promoted_from)
         p_raw = _ia2_attrs(promoted_from)
-        p_attrs = _augment_attrs_for_readability(promoted_from, p_chain, p_raw, base)
+        p_attrs = _augment_attrs_for_readability(promoted_from, p_chain, p_index, p_raw, base)
         p_tag = p_attrs.get("tag", _tag(promoted_from)) or "unknown"
-        lines.append("Nested element:")
-        lines.append(_format_tag_block(p_tag, p_attrs).rstrip())
-
-    ancCount = 0
-    for ancestor in canonical_chain[1:]:
-        ancCount += 1
-        if ancCount <= 4:
-            _dbg_obj(ancestor, f"ANCESTOR#{ancCount}")
-        a_chain = _dom_chain_with_tags(ancestor)
-        a_raw = _ia2_attrs(ancestor)
-        _dbg(f"Ancestor tag: {_tag(ancestor)} | IA2 raw: {a_raw}")
-        try:
-            _dbg(f"Ancestor NVDA role: {getattr(ancestor, 'role', None)}")
-        except Exception:
-            pass
-        a_attrs = _augment_attrs_for_readability(ancestor, a_chain, a_raw, base)
+        # The label trails the previous block; keep it there.
+        tag_blocks[-1][1].append("Nested element:")
+        _add_block(p_tag, p_attrs)
+
+    # Each ancestor's own chain is a suffix of the canonical chain; slice it
+    # rather than walking the parents again. If the canonical walk stopped at
+    # the depth cap before #document, a fresh walk from the ancestor reaches
+    # further, so fall back to that.
+    chain_complete = "#document" in canonical_index
+    for ancCount in range(1, len(canonical_chain)):
+        af = canonical_chain[ancCount]
+        ancestor = af.obj
+        if chain_complete:
+            a_chain = canonical_chain[ancCount:]
+            a_index = _index_chain(a_chain)
+        else:
+            a_chain, a_index = _dom_chain_with_tags(ancestor)
+        a_raw = af.attrs
+        if DEBUG_MODE:
+            if ancCount <= 4:
+                _dbg_obj(ancestor, "ANCESTOR#%d" % ancCount)
+            _dbg("Ancestor tag: %s | IA2 raw: %s", af.tag, a_raw)
+            try:
+                _dbg("Ancestor NVDA role: %s", getattr(ancestor, "role", None))
+            except Exception:
+                pass
+        a_attrs = _augment_attrs_for_readability(ancestor, a_chain, a_index, a_raw, base)
         a_tag = a_attrs.get("tag", _tag(ancestor)) or "unknown"
-        lines.append(_format_tag_block(a_tag, a_attrs).rstrip())
+        _add_block(a_tag, a_attrs)
 
-    report = "\n".join([ln for ln in lines if ln is not None]).strip() + "\n"
+    def _pre_block(text):
+        return "<pre>" + _ESC(text) + "</pre>"
 
     if not advanced:
-        return report, True
+        buf = io.StringIO()
+        _write_line(buf, "<h1>Element Information</h1>")
+        for tag_name, block_lines in tag_blocks:
+            _write_line(buf, f"<h2>Tag {_ESC(tag_name)}</h2>")
+            _write_line(buf, _pre_block("\n".join(block_lines)))
+        return buf.getvalue(), True
 
     # Advanced mode: provide real headings for browse-mode navigation.
-    def _h_escape(s):
-        try:
-            return html.escape(_safe(s))
-        except Exception:
-            return html.escape(str(s))
-
-    def _pre_block(text):
-        return "<pre>" + _h_escape(text) + "</pre>"
-
     # Build subtree (children) under the canonical element.
     subtree_lines = []
     max_depth = 3
     max_nodes = 30
 
-    def _iter_subtree(root):
+    def _collect_subtree(root):
+        """Return ([(node, depth, ia2 attrs), ...], truncated) for tagged nodes under root, breadth first."""
+        nodes = []
         if not root:
-            return
+            return nodes, False
         try:
             first = getattr(root, "firstChild", None)
         except Exception:
             first = None
-        queue = []
+        queue = deque()
+        # Dedup on enqueue so cycles never inflate the queue.
+        enqueued = set()
+        seen_add = enqueued.add
+        push = queue.append
+
         if first:
-            queue.append((first, 1))
-        seen = set()
-        yielded = 0
-        while queue and yielded < max_nodes:
-            node, depth = queue.pop(0)
-            if not node:
-                continue
-            oid = id(node)
-            if oid in seen:
-                continue
-            seen.add(oid)
-            # Only include nodes that expose a tag (DOM-like)
+            seen_add(id(first))
+            push((first, 1))
+        while queue:
+            node, depth = queue.popleft()
+            # Only include nodes that expose a tag (DOM-like); untagged nodes are still traversed.
             try:
                 a = _ia2_attrs(node)
-                if not a.get("tag"):
-                    # still traverse children
-                    pass
-                else:
-                    yielded += 1
-                    yield node, depth
+                if a.get("tag"):
+                    nodes.append((node, depth, a))
             except Exception:
                 pass
 
-            if depth >= max_depth:
-                # do not enqueue deeper
+            # enqueue children (unless at max depth) then siblings
+            if depth < max_depth:
                 try:
-                    nxt = getattr(node, "next", None)
+                    child = getattr(node, "firstChild", None)
                 except Exception:
-                    nxt = None
-                if nxt:
-                    queue.append((nxt, depth))
-                continue
-
-            # enqueue children then siblings
-            try:
-                child = getattr(node, "firstChild", None)
-            except Exception:
-                child = None
-            if child:
-                queue.append((child, depth + 1))
+                    child = None
+                if child and id(child) not in enqueued:
+                    seen_add(id(child))
+                    push((child, depth + 1))
             try:
                 nxt = getattr(node, "next", None)
             except Exception:
                 nxt = None
-            if nxt:
-                queue.append((nxt, depth))
+            if nxt and id(nxt) not in enqueued:
+                seen_add(id(nxt))
+                push((nxt, depth))
+
+            if len(nodes) >= max_nodes:
+                # Truncated only when something was left unvisited.
+                return nodes, bool(queue)
+        return nodes, False
 
     child_blocks = []
     truncated = False
     try:
-        for node, depth in _iter_subtree(canonical):
-            a_chain = _dom_chain_with_tags(node)
-            a_raw = _ia2_attrs(node)
-            a_attrs = _augment_attrs_for_readability(node, a_chain, a_raw, base)
+        subtree, truncated = _collect_subtree(canonical)
+        for node, depth, a_raw in subtree:
+            a_chain, a_index = _dom_chain_with_tags(node)
+            a_attrs = _augment_attrs_for_readability(node, a_chain, a_index, a_raw, base)
             a_tag = a_attrs.get("tag", _tag(node)) or "unknown"
             # Keep children minimal: tag/role/name/states + small essentials.
-            keep = {}
-            for k in ("tag", "id", "role", "xml-roles", "href", "src", "type", "accessible-name", "accessible-name-from",
-                      "explicit-name", "explicit-name-from",
-                      "pressed", "expanded", "selected", "checked", "value", "valuetext"):
-                if k in a_attrs:
-                    keep[k] = a_attrs.get(k)
+            keep = {k: a_attrs[k] for k in _CHILD_KEEP_KEYS if k in a_attrs}
             # Let form inference add fsFormField when meaningful but don't force it.
             keep = _infer_form_attrs(node, keep)
-            block = _format_tag_block(a_tag, keep).strip()
-            child_blocks.append((depth, a_tag, block))
-        # If queue had more nodes, we won't know; mark truncation only when we hit max_nodes exactly
-        if len(child_blocks) >= max_nodes:
-            truncated = True
+            block_lines = []
+            # IA2 values and everything the augment/inference steps add are stripped strings.
+            _format_tag_block(a_tag, keep, block_lines, stripped=True)
+            child_blocks.append((depth, a_tag, "\n".join(block_lines)))
     except Exception:
         child_blocks = []
 
     # Render advanced HTML with headings.
-    parts = []
-    parts.append("<h1>Advanced Element Information</h1>")
-    parts.append("<h2>Focused element</h2>")
+    buf = io.StringIO()
+    _write_line(buf, "<h1>Advanced Element Information</h1>")
+    _write_line(buf, "<h2>Focused element</h2>")
     # Render each tag block as its own heading for quick navigation.
-    def _split_tag_blocks(txt):
-        txt = (txt or "").replace("\r\n", "\n").replace("\r", "\n")
-        blocks = []
-        cur = []
-        for line in txt.split("\n"):
-            if line.strip() in ("Element Information:", "Advanced Element Information:"):
-                continue
-            if line.startswith("Tag ") and " has " in line and line.endswith("parameters:"):
-                if cur:
-                    blocks.append("\n".join(cur).strip("\n"))
-                    cur = []
-            cur.append(line)
-        if cur:
-            blocks.append("\n".join(cur).strip("\n"))
-        return [b for b in blocks if b.strip()]
-
-    for b in _split_tag_blocks(report):
-        tag_name = None
-        for ln in b.split("\n"):
-            if ln.startswith("Tag ") and " has " in ln and " parameters:" in ln:
-                try:
-                    tag_name = ln.split("Tag ", 1)[1].split(" has ", 1)[0].strip()
-                except Exception:
-                    tag_name = None
-                break
-        if tag_name:
-            parts.append(f"<h3>Tag {_h_escape(tag_name)}</h3>")
-        parts.append(_pre_block(b))
+    for tag_name, block_lines in tag_blocks:
+        _write_line(buf, f"<h3>Tag {_ESC(tag_name)}</h3>")
+        _write_line(buf, _pre_block("\n".join(block_lines)))
 
     if child_blocks:
-        parts.append("<h2>Children</h2>")
+        _write_line(buf, "<h2>Children</h2>")
         for idx, (depth, tag, block) in enumerate(child_blocks, 1):
             level = 3 if depth <= 1 else 4 if depth == 2 else 5
-            parts.append(f"<h{level}>Child {idx}: {tag.upper()}</h{level}>")
-            parts.append(_pre_block(block))
+            _write_line(buf, f"<h{level}>Child {idx}: {tag.upper()}</h{level}>")
+            _write_line(buf, _pre_block(block))
         if truncated:
-            parts.append("<p>... truncated (limits reached)</p>")
+            _write_line(buf, "<p>... truncated (limits reached)</p>")
     else:
-        parts.append("<h2>Children</h2>")
-        parts.append("<p>No children exposed.</p>")
-        parts.append("<p>Note: subtree not exposed by the accessibility API.</p>")
+        _write_line(buf, "<h2>Children</h2>")
+        _write_line(buf, "<p>No children exposed.</p>")
+        _write_line(buf, "<p>Note: subtree not exposed by the accessibility API.</p>")
 
-    html_report = "\n".join(parts)
+    html_report = buf.getvalue()
     return html_report, True
 
 
-
-
-def _report_text_to_html(report_text, title_h1):
-    """Convert plain text report into simple HTML with headings for quick navigation."""
-    def _esc(s):
-        try:
-            return html.escape(_safe(s))
-        except Exception:
-            return html.escape(str(s))
-
-    txt = report_text or ""
-    # Normalize line endings
-    txt = txt.replace("\r\n", "\n").replace("\r", "\n")
-    # Split into tag blocks. Our formatter inserts a blank line before each 'Tag ...' header.
-    blocks = []
-    cur = []
-    for line in txt.split("\n"):
-        if line.startswith("Tag ") and " has " in line and line.endswith("parameters:"):
-            if cur:
-                blocks.append("\n".join(cur).strip("\n"))
-                cur = []
-        cur.append(line)
-    if cur:
-        blocks.append("\n".join(cur).strip("\n"))
-
-    parts = []
-    parts.append(f"<h1>{_esc(title_h1)}</h1>")
-    # Filter out the initial "Element Information:" line if present.
-    for b in blocks:
-        b_stripped = b.strip()
-        if not b_stripped:
-            continue
-        if b_stripped == "Element Information:" or b_stripped == "Advanced Element Information:":
-            continue
-        # Try to extract the tag name from the header line.
-        tag_name = None
-        for ln in b_stripped.split("\n"):
-            if ln.startswith("Tag ") and " has " in ln and " parameters:" in ln:
-                try:
-                    tag_name = ln.split("Tag ", 1)[1].split(" has ", 1)[0].strip()
-                except Exception:
-                    tag_name = None
-                break
-        if tag_name:
-            parts.append(f"<h2>Tag { _esc(tag_name) }</h2>")
-        parts.append("<pre>" + _esc(b_stripped) + "</pre>")
-    return "\n".join(parts)
-
-
 class GlobalPlugin(globalPluginHandler.GlobalPlugin):
     scriptCategory = _("Web Element Inspector")
     __gestures = {
@@ -1456,11 +1451,10 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 
     @script(description=_("Inspect the current HTML element under the browse cursor (Basic report)."))
     def script_inspectWebElement(self, gesture):
-        report, ok = _build_report(advanced=False)
+        htmlReport, ok = _build_report(advanced=False)
         if not ok:
-            ui.message(report)
+            ui.message(htmlReport)
             return
-        htmlReport = _report_text_to_html(report, "Element Information")
         try:
             ui.browseableMessage(htmlReport, title=_("HTML Element Inspector"), isHtml=True)
         except TypeError:
@@ -1469,15 +1463,15 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 
     @script(description=_("Inspect the focused HTML element and explore its children (advanced report)."))
     def script_inspectWebElementAdvanced(self, gesture):
-        report, ok = _build_report(advanced=True)
+        htmlReport, ok = _build_report(advanced=True)
         if not ok:
-            ui.message(report)
+            ui.message(htmlReport)
             return
         # Advanced report is HTML (for heading navigation).
         try:
-            ui.browseableMessage(report, title=_("HTML Element Inspector (Advanced)"), isHtml=True)
+            ui.browseableMessage(htmlReport, title=_("HTML Element Inspector (Advanced)"), isHtml=True)
         except TypeError:
             # Older signatures: fall back to plain browseable message.
-            ui.browseableMessage(report, title=_("HTML Element Inspector (Advanced)"))
+            ui.browseableMessage(htmlReport, title=_("HTML Element Inspector (Advanced)"))
         ui.message(_("Advanced inspector report shown."))
 